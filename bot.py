@@ -1,6 +1,7 @@
 import time
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import partial
 
 from utils import *
 
@@ -15,25 +16,27 @@ def process_sitemap(date = None, filter_by_date = True):
         print('Unable to download and extract sitemap. Exiting...')
         return
 
-    urls = parse_sitemap(config['sitemap_file'])
-    if not urls:
-        print("Failed to parse sitemap. Exiting...")
-        return
-        
-    print(f"Found {len(urls)} URLs in the sitemap.")
-    
+    target_dates = None
     if filter_by_date:
         if(type(date) == str):    
             date = [date]
-        filtered_urls = filter_urls_by_dates(urls, date)
-    else:
-        filtered_urls = [url for url, lastmod in urls]
+        target_dates = set(date)
+    
+    processed = ProcessedUrlIndex([config['processed_urls'], config['unprocessed_urls']])
+    # processed = ProcessedUrlIndex([config['processed_urls'], config['unprocessed_urls'], config['unsaved_urls']])
 
-    print(f"Found {len(filtered_urls)} URLs for today.")
+    found, matched, filtered_urls, maybe_processed = scan_sitemap(config['sitemap_file'], target_dates, processed)
+
+    if not found:
+        print("Failed to parse sitemap. Exiting...")
+        return
+        
+    print(f"Found {found} URLs in the sitemap.")
+    print(f"Found {matched} URLs for today.")
 
-    filtered_urls = filter_processed_urls(filtered_urls, config['processed_urls'])
-    filtered_urls = filter_processed_urls(filtered_urls, config['unprocessed_urls'])
-    # filtered_urls = filter_processed_urls(filtered_urls, config['unsaved_urls'])
+    # index hits can be Bloom filter false positives, check them against the files
+    confirmed = processed.confirm(maybe_processed)
+    filtered_urls += [url for url in maybe_processed if url not in confirmed]
     
     filtered_urls = filtered_urls[:config['max_scrap']]
 
@@ -41,9 +44,9 @@ def process_sitemap(date = None, filter_by_date = True):
 
     start_time = time.time()
     
-    # create a thread pool of 10 threads
-    with ThreadPoolExecutor() as executor:
-        executor.map(process_url, filtered_urls, [config]*len(filtered_urls))
+    # network-bound, so size the pool from the config rather than the CPU count
+    with ThreadPoolExecutor(max_workers=config.get('max_workers', 16)) as executor:
+        executor.map(partial(process_url, config=config), filtered_urls)
 
     duration = time.time() - start_time
     print(f"Downloaded {len(filtered_urls)} in {duration} seconds")
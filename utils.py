@@ -1,27 +1,69 @@
+import atexit
 import csv
 import gzip
-import io
-import json
 import os
+import queue
+import shutil
+import threading
+import time
 import xml.etree.ElementTree as ET
+from functools import lru_cache
+from pathlib import Path
 from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
 from selenium import webdriver
-from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import (
+    InvalidSessionIdException,
+    NoSuchElementException,
+    NoSuchWindowException,
+    TimeoutException,
+    WebDriverException,
+)
+from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
+from urllib3.util.retry import Retry
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
+try:
+    from pybloom_live import ScalableBloomFilter
+except ImportError:
+    ScalableBloomFilter = None
+
+HTTP_TIMEOUT = 30
+
+# Shared across the worker threads so API and webform calls reuse keep-alive connections
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504]),
+))
+
+# URL sets of the bookkeeping CSV files, keyed by path and kept in sync with the writes below
+_processed_cache = {}
+_processed_cache_lock = threading.Lock()
+
+
+CONFIG_PATH = Path(__file__).parent / 'config.json'
+
+
+@lru_cache(maxsize=1)
 def load_config():
     """
-    Load the configuration file.
+    Load the configuration file. It is only read once per process.
 
     Returns:
         dict: The configuration file as a dictionary.
     """
-    with open('config.json') as config_file:
-        config = json.load(config_file)
+    with open(CONFIG_PATH, 'rb') as config_file:
+        config = _json_loads(config_file.read())
     return config
 
 
@@ -37,18 +79,18 @@ def load_sitemap(url, output_path):
     """
     print('Downloading sitemap...')
     try:
-        response = requests.get(url)
+        response = requests.get(url, stream=True)
         response.raise_for_status()
     except requests.exceptions.RequestException as err:
         print(f"An error occurred while downloading the sitemap: {err}")
         return False
     
     try:
-        compressed_file = io.BytesIO(response.content)
-        decompressed_file = gzip.GzipFile(fileobj=compressed_file)
-        
-        with open(output_path, 'wb') as outfile:
-            outfile.write(decompressed_file.read())
+        with response:
+            # undo any Content-Encoding, the same way response.content would
+            response.raw.decode_content = True
+            with gzip.GzipFile(fileobj=response.raw) as decompressed_file, open(output_path, 'wb') as outfile:
+                shutil.copyfileobj(decompressed_file, outfile, length=1 << 16)
     except Exception as err:
         print(f"An error occurred while decompressing the sitemap file: {err}")
         return False
@@ -56,6 +98,32 @@ def load_sitemap(url, output_path):
     return True
 
 
+SITEMAP_NAMESPACE = '{http://www.sitemaps.org/schemas/sitemap/0.9}'
+
+
+def iter_sitemap(sitemap_path):
+    """
+    Stream the URLs and last modification dates out of the sitemap file.
+
+    Args:
+        sitemap_path (str): The path to the sitemap file.
+
+    Yields:
+        tuple: The URL and last modification date of each entry.
+
+    Raises:
+        ET.ParseError: If the sitemap is malformed.
+    """
+    root = None
+    for event, elem in ET.iterparse(sitemap_path, events=('start', 'end')):
+        if root is None:
+            root = elem
+        if event == 'end' and elem.tag == f'{SITEMAP_NAMESPACE}url':
+            yield elem.findtext(f'{SITEMAP_NAMESPACE}loc'), elem.findtext(f'{SITEMAP_NAMESPACE}lastmod')
+            # drop the finished <url> from the root too, or the root keeps them all alive
+            root.clear()
+
+
 def parse_sitemap(sitemap_path):
     """
     Parse the sitemap file and extract the URLs and last modification dates.
@@ -68,19 +136,43 @@ def parse_sitemap(sitemap_path):
     """
     
     try:
-        tree = ET.parse(sitemap_path)
+        return list(iter_sitemap(sitemap_path))
     except ET.ParseError as err:
         print(f"An error occurred while parsing the sitemap: {err}")
         return []
 
-    root = tree.getroot()
+def scan_sitemap(sitemap_path, dates, processed):
+    """
+    Filter the sitemap URLs by date and by the processed index in a single
+    streaming pass.
 
-    # Namespace dictionary to access the "loc" and "lastmod" tags
-    namespaces = {'ns': 'http://www.sitemaps.org/schemas/sitemap/0.9'}
+    Args:
+        sitemap_path (str): The path to the sitemap file.
+        dates (set): The last modification dates to keep, or None to keep all.
+        processed (ProcessedUrlIndex): Index of the URLs already handled.
 
-    urls = [(url.find('ns:loc', namespaces).text, url.find('ns:lastmod', namespaces).text) for url in root.findall('.//ns:url', namespaces)]
+    Returns:
+        tuple: The number of URLs in the sitemap (0 if it couldn't be parsed), the
+            number matching the dates, the URLs not in the index, and the index hits.
+    """
+    found = matched = 0
+    unprocessed = []
+    maybe_processed = []
+    try:
+        for url, lastmod in iter_sitemap(sitemap_path):
+            found += 1
+            if dates is not None and lastmod not in dates:
+                continue
+            matched += 1
+            if url in processed:
+                maybe_processed.append(url)
+            else:
+                unprocessed.append(url)
+    except ET.ParseError as err:
+        print(f"An error occurred while parsing the sitemap: {err}")
+        found = 0
+    return found, matched, unprocessed, maybe_processed
 
-    return urls
 
 def filter_urls_by_date(urls, date):
     """
@@ -106,7 +198,8 @@ def filter_urls_by_dates(urls, dates):
     Returns:
         list: A list of URLs that match the date.
     """
-    return [url for url, lastmod in urls if lastmod in dates]
+    date_set = frozenset(dates)
+    return [url for url, lastmod in urls if lastmod in date_set]
 
 def save_urls_to_file(file_path, urls):
     """
@@ -120,39 +213,214 @@ def save_urls_to_file(file_path, urls):
         print("No URLs to save.")
         return
     try:
-        with open(file_path, 'a', newline='') as f:
-            writer = csv.writer(f)
-            for url in urls:
-                writer.writerow([url])
+        with _processed_cache_lock:
+            # one URL per row and URLs need no quoting, so skip the csv module
+            with open(file_path, 'a', newline='') as f:
+                f.write(''.join(f"{url}\n" for url in urls))
+            if file_path in _processed_cache:
+                _processed_cache[file_path].update(urls)
     except Exception as err:
         print(f"An error occurred while writing to the CSV file: {err}")
         
-def remove_url_from_file(file_path, url):
+def remove_urls_from_file(file_path, urls_to_remove):
     """
-    Remove the URL from the CSV file.
+    Remove the URLs from the CSV file, rewriting it once.
 
     Args:
         file_path (string): The path to the CSV file.
-        url (string): The URL to remove.
+        urls_to_remove (set): The URLs to remove.
     """
-    try:
-        with open(file_path, 'r', newline='') as f:
-            reader = csv.reader(f)
-            processed_urls = [row[0] for row in reader]
-    except FileNotFoundError:
-        # If the file doesn't exist yet, consider all URLs as unprocessed
-        processed_urls = []
+    # pending batched rows would otherwise be appended again after the rewrite
+    with _csv_writers_lock:
+        writer = _csv_writers.pop(file_path, None)
+    if writer:
+        writer.close()
 
-    processed_urls.remove(url)
-    
-    try:
-        with open(file_path, 'w', newline='') as f:
-            writer = csv.writer(f)
-            for url in processed_urls:
-                writer.writerow([url])
-    except Exception as err:
-        print(f"An error occurred while writing to the CSV file: {err}")
-        
+    processed_urls = load_processed_urls(file_path)
+
+    with _processed_cache_lock:
+        processed_urls.difference_update(urls_to_remove)
+        try:
+            with open(file_path, 'w', newline='') as f:
+                f.write(''.join(f"{url}\n" for url in processed_urls))
+        except Exception as err:
+            print(f"An error occurred while writing to the CSV file: {err}")
+
+
+class BatchedCsvWriter:
+    """
+    Append URLs to a CSV file from a background thread, writing them in batches
+    through a single buffered file handle instead of reopening the file per URL.
+
+    Each batch is flushed to the file as soon as it is written, and its URLs join
+    the _processed_cache set then. If the file can't be written, the writer falls
+    back to save_urls_to_file for the URLs it still holds and for any added later.
+
+    URLs waiting in the current batch (up to batch_size of them, or flush_interval
+    seconds' worth) are not on disk yet. If the process is killed before they are
+    written, the next run will post them to the webform again.
+
+    Args:
+        file_path (string): The path to the CSV file.
+        batch_size (int, optional): Number of URLs to collect before writing. Defaults to 100.
+        flush_interval (float, optional): Seconds after which a partial batch is written out. Defaults to 5.
+    """
+
+    _STOP = object()
+
+    def __init__(self, file_path, batch_size=100, flush_interval=5.0):
+        self.file_path = file_path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._failed = False
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def add(self, url):
+        """
+        Queue the URL to be written.
+
+        Args:
+            url (string): The URL to save.
+        """
+        if self._failed:
+            save_urls_to_file(self.file_path, [url])
+            return
+        self._queue.put(url)
+
+    def close(self):
+        """
+        Write the pending URLs and close the file.
+        """
+        self._queue.put(self._STOP)
+        self._thread.join()
+        # URLs queued while the writer thread was failing
+        self._save_queued([])
+
+    def _save_queued(self, urls):
+        while True:
+            try:
+                url = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if url is not self._STOP:
+                urls.append(url)
+        if urls:
+            save_urls_to_file(self.file_path, urls)
+
+    def _flushed(self, urls):
+        with _processed_cache_lock:
+            if self.file_path in _processed_cache:
+                _processed_cache[self.file_path].update(urls)
+        urls.clear()
+
+    def _run(self):
+        batch = []
+        try:
+            with open(self.file_path, 'a', newline='', buffering=1 << 16) as f:
+                deadline = time.monotonic() + self.flush_interval
+                while True:
+                    try:
+                        url = self._queue.get(timeout=max(0, deadline - time.monotonic()))
+                    except queue.Empty:
+                        url = None
+
+                    stop = url is self._STOP
+                    if url is not None and not stop:
+                        batch.append(url)
+
+                    timed_out = time.monotonic() >= deadline
+                    if batch and (stop or timed_out or len(batch) >= self.batch_size):
+                        f.write(''.join(f"{url}\n" for url in batch))
+                        f.flush()
+                        self._flushed(batch)
+                    if timed_out:
+                        deadline = time.monotonic() + self.flush_interval
+                    if stop:
+                        return
+        except Exception as err:
+            print(f"An error occurred while writing to the CSV file: {err}")
+            self._failed = True
+            self._save_queued(batch)
+
+
+_csv_writers = {}
+_csv_writers_lock = threading.Lock()
+
+
+def get_csv_writer(file_path):
+    """
+    Get the batched writer for the CSV file, creating it on first use.
+
+    Args:
+        file_path (string): The path to the CSV file.
+
+    Returns:
+        BatchedCsvWriter: The writer for the file.
+    """
+    with _csv_writers_lock:
+        if file_path not in _csv_writers:
+            _csv_writers[file_path] = BatchedCsvWriter(file_path)
+        return _csv_writers[file_path]
+
+
+@atexit.register
+def close_csv_writers():
+    """
+    Write out and close all the batched CSV writers.
+    """
+    with _csv_writers_lock:
+        while _csv_writers:
+            _csv_writers.popitem()[1].close()
+
+
+def iter_row_urls(lines):
+    """
+    Get the URL of each row. URLs are written one per row without quoting, but
+    older files were written with csv.writer, which quotes URLs containing , or ".
+
+    Args:
+        lines (iterable): The rows of the file, without line endings.
+
+    Yields:
+        string: The URL of each non-empty row.
+    """
+    for line in lines:
+        if line.startswith('"'):
+            line = next(csv.reader([line]))[0]
+        if line:
+            yield line
+
+
+def load_processed_urls(file_path):
+    """
+    Load the URLs recorded in a CSV file. The file is only read once; later
+    calls return the cached set, which save_urls_to_file and remove_urls_from_file
+    keep up to date.
+
+    Args:
+        file_path (string): The path to the CSV file.
+
+    Returns:
+        set: The URLs in the file. Shared with the cache, so don't modify it.
+    """
+    with _processed_cache_lock:
+        if file_path not in _processed_cache:
+            try:
+                with open(file_path, 'r') as f:
+                    content = f.read()
+                if '"' in content:
+                    processed_urls = set(iter_row_urls(content.splitlines()))
+                else:
+                    # one unquoted URL per row, so skip the per-row parsing
+                    processed_urls = set(content.splitlines())
+                processed_urls.discard('')
+                _processed_cache[file_path] = processed_urls
+            except FileNotFoundError:
+                # If the file doesn't exist yet, consider all URLs as unprocessed
+                _processed_cache[file_path] = set()
+        return _processed_cache[file_path]
 
 
 def filter_processed_urls(urls, file_path):
@@ -166,15 +434,83 @@ def filter_processed_urls(urls, file_path):
     Returns:
         list: A list of URLs that haven't been processed yet.
     """
+    processed_urls = load_processed_urls(file_path)
+
+    return [url for url in urls if url not in processed_urls]
+
+
+def iter_file_urls(file_path):
+    """
+    Stream the URLs recorded in a CSV file, one per row.
+
+    Args:
+        file_path (string): The path to the CSV file.
+
+    Yields:
+        string: The URLs in the file.
+    """
     try:
-        with open(file_path, 'r', newline='') as f:
-            reader = csv.reader(f)
-            processed_urls = {row[0] for row in reader}
+        with open(file_path, 'r') as f:
+            yield from iter_row_urls(line.rstrip('\r\n') for line in f)
     except FileNotFoundError:
         # If the file doesn't exist yet, consider all URLs as unprocessed
-        processed_urls = set()
+        return
 
-    return [url for url in urls if url not in processed_urls]
+
+class ProcessedUrlIndex:
+    """
+    Membership index over the URLs recorded in several CSV files.
+
+    With pybloom_live installed the index is a scalable Bloom filter, which keeps
+    memory small however long the files grow; a hit may be a false positive, so
+    hits must go through confirm() before being treated as processed. Without it,
+    lookups go straight to the cached per-file sets from load_processed_urls, so
+    no extra copy of the URLs is made and hits are exact.
+
+    The Bloom filter is a snapshot of the files when the index is built: URLs
+    saved afterwards are not added to it. process_sitemap builds a new index
+    for every run, and a run checks each sitemap URL once, before any of them
+    are saved.
+
+    Args:
+        file_paths (list): The paths to the CSV files.
+    """
+
+    def __init__(self, file_paths):
+        self.file_paths = file_paths
+        self._bloom = None
+        if ScalableBloomFilter is None:
+            self._sets = [load_processed_urls(path) for path in file_paths]
+            return
+        self._bloom = ScalableBloomFilter(initial_capacity=100_000, error_rate=0.001)
+        for path in file_paths:
+            for url in iter_file_urls(path):
+                self._bloom.add(url)
+
+    def __contains__(self, url):
+        if self._bloom is None:
+            return any(url in urls for urls in self._sets)
+        return url in self._bloom
+
+    def confirm(self, urls):
+        """
+        Check index hits against the files.
+
+        Args:
+            urls (list): URLs that are in the index.
+
+        Returns:
+            set: The URLs that really are recorded in the files.
+        """
+        if self._bloom is None:
+            return set(urls)
+        pending = set(urls)
+        confirmed = set()
+        for path in self.file_paths:
+            for url in iter_file_urls(path):
+                if url in pending:
+                    confirmed.add(url)
+        return confirmed
 
 
 def create_target_url(url, cutoff=3):
@@ -216,19 +552,112 @@ def create_target_urls(urls, cutoff=3):
 def page_has_loaded(driver):
     return driver.find_element(By.ID, '__layout')
 
-def extract_data(url, to_extract):
-    config = load_config()
+_driver_pool = threading.local()
+_drivers = []
+_drivers_lock = threading.Lock()
+
+
+def create_driver(config):
+    """
+    Create a headless Chrome driver for the configured OS.
+
+    Args:
+        config (dict): Configuration dictionary.
+
+    Returns:
+        WebDriver: The Chrome driver.
+    """
+    if config['os'] == 'mac':
+        executable_path = config['chromedriver_mac']
+    elif config['os'] == 'windows':
+        executable_path = config['chromedriver_windows']
+    else:
+        executable_path = config['chromedriver_linux']
+
+    options = webdriver.ChromeOptions()
+    for argument in ('--headless=new', '--disable-gpu', '--no-sandbox', '--disable-dev-shm-usage'):
+        options.add_argument(argument)
+
+    return webdriver.Chrome(service=Service(executable_path), options=options)
+
+
+def get_driver(config):
+    """
+    Get the Chrome driver of the current thread, starting it on first use.
+
+    Args:
+        config (dict): Configuration dictionary.
+
+    Returns:
+        WebDriver: The Chrome driver.
+    """
+    driver = getattr(_driver_pool, 'driver', None)
+    if driver is None:
+        driver = create_driver(config)
+        _driver_pool.driver = driver
+        with _drivers_lock:
+            _drivers.append(driver)
+    return driver
+
+
+def discard_driver():
+    """
+    Quit the current thread's Chrome driver and drop it from the pool, so the
+    next get_driver call starts a new one.
+    """
+    driver = getattr(_driver_pool, 'driver', None)
+    if driver is None:
+        return
+    _driver_pool.driver = None
+    with _drivers_lock:
+        if driver in _drivers:
+            _drivers.remove(driver)
     try:
-        if config['os'] == 'mac':
-            driver = webdriver.Chrome(config['chromedriver_mac'])
-        elif config['os'] == 'windows':
-            driver = webdriver.Chrome(config['chromedriver_windows'])
-        else:
-            driver = webdriver.Chrome(config['chromedriver_linux'])
-        
-        # driver = webdriver.Chrome()
+        driver.quit()
+    except Exception as err:
+        print(f"An error occurred while closing the browser: {err}")
+
 
-        driver.get(url)
+@atexit.register
+def quit_drivers():
+    """
+    Quit all the Chrome drivers started by get_driver.
+    """
+    with _drivers_lock:
+        while _drivers:
+            try:
+                _drivers.pop().quit()
+            except Exception as err:
+                print(f"An error occurred while closing the browser: {err}")
+
+
+def extract_data(url, to_extract, config, driver=None):
+    """
+    Extract the fields from the page, reusing the thread's browser session.
+
+    Args:
+        url (string): URL of the page.
+        to_extract (dict): Fields to extract, mapped to their class names.
+        config (dict): Configuration dictionary.
+        driver (WebDriver, optional): Driver to use. Defaults to the thread's pooled driver.
+
+    Returns:
+        dict: The extracted fields with data.
+    """
+    pooled = driver is None
+    try:
+        if pooled:
+            driver = get_driver(config)
+
+        try:
+            driver.get(url)
+        except TimeoutException:
+            raise
+        except WebDriverException:
+            # the browser couldn't even navigate, so the session is unusable
+            if pooled:
+                discard_driver()
+            raise
         # driver.implicitly_wait(30)
         WebDriverWait(driver, timeout=10).until(page_has_loaded)
 
@@ -242,8 +671,17 @@ def extract_data(url, to_extract):
                 print(f"Element {field} not found on page {url}")
                 extracted_data[field] = ''
 
-        driver.quit()
         return extracted_data
+    except TimeoutException as err:
+        # a slow page, the browser itself is fine to reuse
+        print(f"An error occurred while extracting data: {err}")
+        return []
+    except (InvalidSessionIdException, NoSuchWindowException) as err:
+        print(f"An error occurred while extracting data: {err}")
+        if pooled:
+            # the session is dead (crashed browser or closed window), start a fresh one next time
+            discard_driver()
+        return []
     except Exception as err:
         print(f"An error occurred while extracting data: {err}")
         return []
@@ -289,12 +727,13 @@ def get_json_data(api_url ,url, key):
         return False
     
     try:
-        response = requests.get(
+        response = _session.get(
             api_url,
             headers={'Authorization': f'Bearer {key}'},
             params={
                 'mlsid': mlsid, 'address': address, 'domain': domain,
-            }
+            },
+            timeout=HTTP_TIMEOUT,
         )
         response.raise_for_status()
     except requests.exceptions.RequestException as err:
@@ -302,7 +741,7 @@ def get_json_data(api_url ,url, key):
         return False
 
     try:
-        response = response.json()
+        response = _json_loads(response.content)
         listing = response['listing']
         if not listing:
             print(f"Listing not found for URL {url}")
@@ -313,6 +752,22 @@ def get_json_data(api_url ,url, key):
         return False
 
 
+_STATUSES = {
+    'comingSoon': 'Coming Soon',
+    'active': 'Available',
+    'openHouse': 'Available',
+    'justListed': 'Available',
+    'priceReduced': 'Price reduced',
+    'sold': 'Sold',
+}
+
+# Fields whose API value needs converting before it is posted; the rest are copied as-is
+_FIELD_HANDLERS = {
+    'photourl': lambda photos: photos[0] if len(photos) else '',
+    'status': lambda status: _STATUSES.get(status, 'Available'),
+}
+
+
 def parse_data(data, toExtract):
     """
     Parse the data and extract the needed fields.
@@ -325,23 +780,11 @@ def parse_data(data, toExtract):
         dict: The extracted fields with data.
     """
     response = {}
-    statuses = {
-        'comingSoon': 'Coming Soon',
-        'active': 'Available',
-        'openHouse': 'Available',
-        'justListed': 'Available',
-        'priceReduced': 'Price reduced',
-        'sold': 'Sold',
-    }
     
     for field, value in toExtract.items():
         if value in data:
-            if field == 'photourl':
-                response[field] = data[value][0] if len(data[value]) else ''
-            elif field == 'status':
-                response[field] = statuses[data[value]] if data[value] in statuses else 'Available'
-            else:
-                response[field] = data[value]
+            handler = _FIELD_HANDLERS.get(field)
+            response[field] = handler(data[value]) if handler else data[value]
         else:
             print(f"Field {field} not found in the response.")
             response[field] = ''
@@ -359,7 +802,11 @@ def post_data(url, data):
     Returns:
         bool: True if the data was posted successfully, False otherwise.
     """
-    response = requests.post(url, data=data)
+    try:
+        response = _session.post(url, data=data, timeout=HTTP_TIMEOUT)
+    except requests.exceptions.RequestException as err:
+        print(f"An error occurred while posting the data: {err}")
+        return False
     if response.status_code == 200:
         print(f"Data posted successfully: {response.text}")
         return True
@@ -386,14 +833,14 @@ def process_url(url, config, max_cutoff = 6):
         new_url = create_target_url(url, current_cutoff)
         if new_url == False:
             print("Failed to create target URL. Exiting.")
-            save_urls_to_file(config['unprocessed_urls'], [url])
+            get_csv_writer(config['unprocessed_urls']).add(url)
             return False
         extracted = get_json_data(config['api_url'], new_url, config['vendor_token'])
         current_cutoff += 1
         
     if not extracted:
         print("Failed to extract data. Exiting.")
-        save_urls_to_file(config['unprocessed_urls'], [url])
+        get_csv_writer(config['unprocessed_urls']).add(url)
         return False
         
     needed = parse_data(extracted, config['api_extraction'])
@@ -403,11 +850,11 @@ def process_url(url, config, max_cutoff = 6):
     
     if not processed:
         print("Failed to post data. Exiting.")
-        save_urls_to_file(config['unsaved_urls'], [url])
+        get_csv_writer(config['unsaved_urls']).add(url)
         return False
     print('Processed URL: ', url)
 
-    save_urls_to_file(config['processed_urls'], [url])
+    get_csv_writer(config['processed_urls']).add(url)
     
     return True
 
@@ -415,11 +862,13 @@ def process_url(url, config, max_cutoff = 6):
 
 def cleanup(filepath):
     """
-    Delete the sitemap file.
+    Write out the pending CSV batches and delete the sitemap file.
 
     Args:
         filepath (string): The path to the sitemap file.
     """
+    close_csv_writers()
+
     print('Deleting sitemap file...')
     os.remove(filepath)
 